@@ -1,7 +1,11 @@
+import functools
+
 from django.utils.translation import ugettext_lazy as _
 from django.contrib.auth import get_user_model
+from django.contrib.auth import password_validation
 from django.contrib.auth.forms import UserCreationForm, PasswordChangeForm
 from django import forms
+from django.db.models import Q
 from django.contrib.admin.widgets import AdminDateWidget
 from django.utils.safestring import mark_safe
 
@@ -9,15 +13,64 @@ from django_password_strength.widgets import (
     PasswordStrengthInput,
     PasswordConfirmationInput
 )
-from django_countries import widgets, countries
-from smartfields import fields
-import re
+from django_countries import widgets
+from django_countries.fields import CountryField
 
 from . import models
+from .validators import CharacterClassValidator
+
+
+@functools.lru_cache(maxsize=None)
+def _password_change_validators():
+    """Stricter than AUTH_PASSWORD_VALIDATORS, which also covers sign up and
+    createsuperuser; only applied when changing a password."""
+    return [
+        password_validation.UserAttributeSimilarityValidator(
+            user_attributes=('username', 'first_name', 'last_name')),
+        password_validation.MinimumLengthValidator(min_length=14),
+        password_validation.CommonPasswordValidator(),
+        password_validation.NumericPasswordValidator(),
+        CharacterClassValidator(),
+    ]
+
+
+_NEW_PASSWORD_HELP = mark_safe(
+    '<ul>\n'
+    '<li>Must not be the same as the current password</li>\n'
+    '<li>Minimum password length of 14 characters</li>\n'
+    '<li>Must use both uppercase and lowercase letters</li>\n'
+    '<li>Must include one or more numerical digits</li>\n'
+    '<li>Must include at least one special character, such as @, #, or'
+    ' $</li>\n'
+    "<li>Cannot contain your player name or parts of your full name, "
+    'such as your first name</li>\n'
+    '</ul>'
+)
 
 
-class UserCreateForm(UserCreationForm):
-    """Form for creating a new user."""
+class VerifyEmailMixin():
+    """Check that verify_email matches the already cleaned email field once
+    both are normalized the way the user manager stores them."""
+    def clean_verify_email(self):
+        normalize_email = models.User.objects.normalize_email
+        email = self.cleaned_data.get('email')
+        verify = normalize_email(self.cleaned_data.get('verify_email'))
+
+        if email is not None and normalize_email(email) != verify:
+            raise forms.ValidationError(
+                _("You need to enter the same email in both fields"),
+                code='email_mismatch'
+            )
+        return verify
+
+
+class UserCreateForm(VerifyEmailMixin, UserCreationForm):
+    """Form for creating a new user.
+
+    clean() checks email and username uniqueness with a single query, and
+    validate_unique() is overridden only to drop both fields from the
+    model's own unique checks.
+    """
     verify_email = forms.EmailField(label="Please verify your email address.")
 
     class Meta:
@@ -33,60 +86,60 @@ class UserCreateForm(UserCreationForm):
         model = get_user_model()
 
     def clean(self):
-        data = self.cleaned_data
-        email = data.get('email')
-        verify = data.get('verify_email')
-
-        if email != verify:
-            raise forms.ValidationError(
-                "You need to enter the same email in both fields"
-            )
-        return data
+        cleaned_data = super(UserCreateForm, self).clean()
+        email = models.User.objects.normalize_email(cleaned_data.get('email'))
+        username = cleaned_data.get('username')
+
+        # Check email and username uniqueness with a single query instead of
+        # one per field in validate_unique
+        lookup = Q()
+        if email:
+            lookup |= Q(email=email)
+        if username:
+            lookup |= Q(username=username)
+        if lookup:
+            model = self._meta.model
+            taken = model.objects.filter(lookup).values_list('email',
+                                                             'username')
+            for taken_email, taken_username in taken:
+                if email and taken_email == email:
+                    self.add_error('email', self.instance.unique_error_message(
+                        model, ('email',)))
+                if username and taken_username == username:
+                    self.add_error('username',
+                        self.instance.unique_error_message(
+                            model, ('username',)))
+        return cleaned_data
+
+    def validate_unique(self):
+        exclude = self._get_validation_exclusions()
+        exclude.extend(['email', 'username'])
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except forms.ValidationError as e:
+            self._update_errors(e)
 
 
 class UserProfileUpdateForm(forms.ModelForm):
     """Update user profile information."""
-    avatar = fields.ImageField(blank=True)
     location = forms.CharField(
         max_length=40,
         widget=forms.TextInput(attrs={'placeholder': 'Enter city, state'}),
     )
-    country = forms.ChoiceField(
+    country = CountryField().formfield(
         widget=widgets.CountrySelectWidget,
-        choices=countries,
         label='Country of Residence'
     )
 
-    # Definition of preferred positions on the field
-    striker = 'STR'
-    midfielder = 'MID'
-    defender = 'DEF'
-    goalkeeper = 'GKP'
-    PREFERRED_POSITIONS = [
-        (striker, 'Striker'),
-        (midfielder, 'Midfielder'),
-        (defender, 'Defender'),
-        (goalkeeper, 'Goalkeeper'),
-    ]
     preferred_position = forms.ChoiceField(
-        choices=PREFERRED_POSITIONS,
+        choices=models.PREFERRED_POSITIONS,
         label='Preferred position',
-        initial=striker,
+        initial=models.STRIKER,
     )
-
-    # Definition of preferred foot
-    left = 'L'
-    right = 'R'
-    both = 'B'
-    PREFERRED_FOOT = [
-        (right, 'Right'),
-        (left, 'Left'),
-        (both, 'Both')
-    ]
     preferred_foot = forms.ChoiceField(
-        choices=PREFERRED_FOOT,
+        choices=models.PREFERRED_FOOT,
         label='Preferred foot',
-        initial=right,
+        initial=models.RIGHT_FOOT,
     )
 
     class Meta:
@@ -103,11 +156,8 @@ class UserUpdateForm(forms.ModelForm):
         model = models.User
         fields = ['first_name', 'last_name', 'username']
 
-    def clean(self):
-        data = self.cleaned_data
-
 
-class UserUpdateEmail(forms.ModelForm):
+class UserUpdateEmail(VerifyEmailMixin, forms.ModelForm):
     """Form for updating user email."""
     verify_email = forms.EmailField(label="Please verify your email address.")
 
@@ -115,20 +165,13 @@ class UserUpdateEmail(forms.ModelForm):
         model = models.User
         fields = ['email', 'verify_email']
 
-    def clean(self):
-        data = self.cleaned_data
-        email = data.get('email')
-        verify = data.get('verify_email')
-
-        if email != verify:
-            raise forms.ValidationError(
-                "You need to enter the same email in both fields"
-            )
-
 
 class ValidatingPasswordChangeForm(PasswordChangeForm):
-    """Form for changing user's password."""
-    MIN_LENGTH = 14
+    """Form for changing user's password.
+
+    Length and character class rules are enforced on new_password2 by
+    _password_change_validators() instead of AUTH_PASSWORD_VALIDATORS.
+    """
 
     new_password1 = forms.CharField(
         widget=PasswordStrengthInput(attrs={'placeholder': 'New password'}),
@@ -148,66 +191,57 @@ class ValidatingPasswordChangeForm(PasswordChangeForm):
     def __init__(self, *args, **kwargs):
         self.request = kwargs.pop("request", None)
         super(ValidatingPasswordChangeForm, self).__init__(*args, **kwargs)
-        self.fields['new_password1'].help_text = mark_safe(
-            '<ul>\n'
-            '<li>Must not be the same as the current password</li>\n'
-            '<li>Minimum password length of 14 characters</li>\n'
-            '<li>Must use both uppercase and lowercase letters</li>\n'
-            '<li>Must include one or more numerical digits</li>\n'
-            '<li>Must include at least one special character, such as @, #, or'
-            ' $</li>\n'
-            "<li>Cannot contain your player name or parts of your full name, "
-            'such as your first name</li>\n'
-            '</ul>'
-        )
+        self.fields['new_password1'].help_text = _NEW_PASSWORD_HELP
+
+    def clean_new_password2(self):
+        password1 = self.cleaned_data.get('new_password1')
+        password2 = self.cleaned_data.get('new_password2')
+        if password1 and password2 and password1 != password2:
+            raise forms.ValidationError(
+                self.error_messages['password_mismatch'],
+                code='password_mismatch',
+            )
+        password_validation.validate_password(
+            password2, self.user,
+            password_validators=_password_change_validators())
+        return password2
 
     def clean(self):
+        cleaned_data = super(ValidatingPasswordChangeForm, self).clean()
         user = self.request.user
-        new_password = self.cleaned_data.get('new_password1')
-        old_password = self.cleaned_data.get('old_password')
+        new_password = cleaned_data.get('new_password1')
+        old_password = cleaned_data.get('old_password')
+
+        # The old password has already been verified by clean_old_password,
+        # which leaves it out of cleaned_data when it is incorrect.
+        if not old_password or not new_password:
+            return cleaned_data
 
         # Must not be the same as the current password
-        if user.check_password(old_password):
-            if new_password == old_password:
-                raise forms.ValidationError(
-                    "New password cannot match the old password.")
-        else:
-            raise forms.ValidationError("Your old password was entered "
-                "incorrectly. Please enter it again. ")
-
-        # Must use both uppercase and lowercase letters
-        if not re.search('([a-z])+', new_password) or \
-          not re.search('([A-Z])+', new_password):
-            raise forms.ValidationError("The new password must use both "
-                "uppercase and lowercase letters.")
-
-        # Minimum password length of 14 characters
-        if len(new_password) < self.MIN_LENGTH:
+        if new_password == old_password:
             raise forms.ValidationError(
-                "The new password must be at least %d characters long." %
-                self.MIN_LENGTH
-            )
-
-        # Must include of one or more numerical digits
-        if not re.search('\d+', new_password):
-            raise forms.ValidationError("The new password must include one or "
-                "more numerical digits.")
-
-        # Must include of special characters, such as @, #, $
-        if not re.search('([@#$])+', new_password):
-            raise forms.ValidationError("The new password must include the at "
-                "least one of the following characters: @, #, or $.")
+                _("New password cannot match the old password."),
+                code='password_unchanged')
 
         # Cannot contain the username or parts of the user’s full name, such
         # as his first name
         user_first_name = user.first_name.lower()
         user_last_name = user.last_name.lower()
-        user_player_name = user.player_name.lower()
+        user_player_name = (user.username or '').lower()
+        new_password_lower = new_password.lower()
 
-        if (user_first_name in new_password.lower() or user_last_name in
-          new_password.lower() or user_player_name in new_password.lower()):
-            raise forms.ValidationError("The new password cannot contain your "
-                "player name ({}) or parts of your full name ({} {}).".format(
-                    user.player_name, user.first_name, user.last_name))
-
-        return self.cleaned_data
+        if ((user_first_name and user_first_name in new_password_lower) or
+          (user_last_name and user_last_name in new_password_lower) or
+          (user_player_name and user_player_name in new_password_lower)):
+            raise forms.ValidationError(
+                _("The new password cannot contain your player name "
+                  "(%(username)s) or parts of your full name "
+                  "(%(first)s %(last)s)."),
+                code='password_contains_name',
+                params={
+                    'username': user.username,
+                    'first': user.first_name,
+                    'last': user.last_name,
+                })
+
+        return cleaned_data
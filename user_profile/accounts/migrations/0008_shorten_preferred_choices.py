@@ -0,0 +1,36 @@
+# Generated by Django 3.0.5 on 2026-10-14 14:49
+
+from django.db import migrations, models
+
+
+def clear_unknown_choices(apps, schema_editor):
+    # These columns were renamed from fav_animal and hobby, so older rows may
+    # hold free text that does not fit the shortened columns.
+    UserProfile = apps.get_model('accounts', 'UserProfile')
+    UserProfile.objects.exclude(
+        preferred_position__in=['STR', 'MID', 'DEF', 'GKP']
+    ).update(preferred_position=None)
+    UserProfile.objects.exclude(
+        preferred_foot__in=['R', 'L', 'B']
+    ).update(preferred_foot=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_auto_20200413_1510'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_unknown_choices, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='preferred_foot',
+            field=models.CharField(blank=True, choices=[('R', 'Right'), ('L', 'Left'), ('B', 'Both')], max_length=1, null=True),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='preferred_position',
+            field=models.CharField(blank=True, choices=[('STR', 'Striker'), ('MID', 'Midfielder'), ('DEF', 'Defender'), ('GKP', 'Goalkeeper')], max_length=3, null=True),
+        ),
+    ]
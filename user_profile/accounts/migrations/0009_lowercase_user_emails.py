@@ -0,0 +1,41 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    # Users are looked up by their lowercased email, so existing rows have
+    # to be stored the same way.
+    User = apps.get_model('accounts', 'User')
+    duplicates = (
+        User.objects.annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    conflicts = list(
+        User.objects.annotate(email_lower=Lower('email'))
+        .filter(email_lower__in=list(duplicates))
+        .order_by('email_lower', 'id')
+        .values_list('id', 'email')
+    )
+    if conflicts:
+        raise RuntimeError(
+            "Cannot lowercase user emails: these accounts only differ by the "
+            "case of their email and must be merged first: {}".format(
+                ', '.join('{} (id {})'.format(email, pk)
+                          for pk, email in conflicts)))
+
+    User.objects.update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_shorten_preferred_choices'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
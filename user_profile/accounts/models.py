@@ -5,6 +5,7 @@ from django.contrib.auth.models import (
 )
 from django.db import models
 from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.conf import settings
 from django.urls import reverse
@@ -13,10 +14,34 @@ from smartfields import fields
 from django_countries.fields import CountryField
 
 
+# Definition of preferred positions on the field
+STRIKER = 'STR'
+MIDFIELDER = 'MID'
+DEFENDER = 'DEF'
+GOALKEEPER = 'GKP'
+PREFERRED_POSITIONS = (
+    (STRIKER, 'Striker'),
+    (MIDFIELDER, 'Midfielder'),
+    (DEFENDER, 'Defender'),
+    (GOALKEEPER, 'Goalkeeper'),
+)
+
+# Definition of preferred foot
+LEFT_FOOT = 'L'
+RIGHT_FOOT = 'R'
+BOTH_FEET = 'B'
+PREFERRED_FOOT = (
+    (RIGHT_FOOT, 'Right'),
+    (LEFT_FOOT, 'Left'),
+    (BOTH_FEET, 'Both'),
+)
+
+
 class UserManager(BaseUserManager):
     """Create and manage users."""
     def create_user(self, first_name, last_name, email,
-                    username=None, password=None):
+                    username=None, password=None, is_staff=False,
+                    is_superuser=False):
         if not email:
             raise ValueError("Users must have an email address")
         if not first_name:
@@ -30,25 +55,36 @@ class UserManager(BaseUserManager):
             first_name=first_name,
             last_name=last_name,
             email=self.normalize_email(email),
-            username=username
+            username=username,
+            is_staff=is_staff,
+            is_superuser=is_superuser
         )
         user.set_password(password)
         user.save()
         return user
 
+    @classmethod
+    def normalize_email(cls, email):
+        # Emails are stored fully lowercased, so exact lookups on the
+        # normalized value are case-insensitive and still use the unique
+        # index. This also covers the domain lowercasing of the base class.
+        return (email or '').strip().lower()
+
+    def get_by_natural_key(self, username):
+        return self.get(**{self.model.USERNAME_FIELD:
+                           self.normalize_email(username)})
+
     def create_superuser(self, first_name, last_name, email, password,
         username=None):
-        user = self.create_user(
+        return self.create_user(
             first_name,
             last_name,
             email,
-            username,
-            password
+            username=username,
+            password=password,
+            is_staff=True,
+            is_superuser=True
         )
-        user.is_staff = True
-        user.is_superuser = True
-        user.save()
-        return user
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -69,6 +105,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return "@{}".format(self.username)
 
+    def clean(self):
+        super(User, self).clean()
+        self.email = self.__class__.objects.normalize_email(self.email)
+
     def get_short_name(self):
         return self.first_name
 
@@ -83,13 +123,13 @@ class UserProfile(models.Model):
     avatar = fields.ImageField(upload_to='avatar_photos/', blank=True, null=True)
     location = models.CharField(max_length=40, blank=True, null=True)
     country = CountryField(blank=True, null=True)
-    preferred_position = models.CharField(max_length=40, blank=True, null=True)
-    preferred_foot = models.CharField(max_length=40, blank=True, null=True)
+    preferred_position = models.CharField(max_length=3, blank=True, null=True,
+                                          choices=PREFERRED_POSITIONS)
+    preferred_foot = models.CharField(max_length=1, blank=True, null=True,
+                                      choices=PREFERRED_FOOT)
 
 
+@receiver(post_save, sender=User, dispatch_uid='create_user_profile')
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
-        UserProfile.objects.create(user=instance)
-
-
-post_save.connect(create_user_profile, sender=User)
+        UserProfile.objects.get_or_create(user=instance)
@@ -4,9 +4,11 @@ from django.core.urlresolvers import reverse
 from django.contrib.auth import get_user_model
 from django.db.models.signals import post_save
 from django.contrib.auth.forms import AuthenticationForm
+from django.core.exceptions import ValidationError
 
 from accounts.models import User, UserProfile, create_user_profile
 from accounts.forms import * # import all forms
+from accounts.validators import CharacterClassValidator
 
 user_create_form_data = {
     'first_name': 'Test',
@@ -179,6 +181,28 @@ class UserModelTests(TestDataMixin, TestCase):
         username = user.username
         self.assertEqual(username, 'test')
 
+    def test_user_email_lowercased(self):
+        user = User.objects.create_user(
+            first_name='Test',
+            last_name='Client',
+            email='Test.Client@Gmail.com',
+            password='password'
+        )
+        self.assertEqual(user.email, 'test.client@gmail.com')
+        self.assertEqual(
+            User.objects.get_by_natural_key('TEST.client@gmail.COM'), user)
+
+    def test_user_email_stripped(self):
+        user = User.objects.create_user(
+            first_name='Test',
+            last_name='Client',
+            email='  Test.Client@Gmail.com ',
+            password='password'
+        )
+        self.assertEqual(user.email, 'test.client@gmail.com')
+        self.assertEqual(
+            User.objects.get_by_natural_key('test.client@gmail.com'), user)
+
     def test_superuser_creation(self):
         user = User.objects.create_superuser(
             first_name='Test',
@@ -187,6 +211,8 @@ class UserModelTests(TestDataMixin, TestCase):
             password='password'
         )
         self.assertEqual(user.is_staff, True)
+        self.assertEqual(user.is_superuser, True)
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
 
 
 ################################
@@ -207,11 +233,52 @@ class UserCreateFormTests(TestCase):
         form = UserCreateForm(data=user_create_form_data)
         self.assertTrue(form.is_valid())
 
+    # The password change rules do not apply when signing up
+    def test_UserCreateForm_default_password_rules(self):
+        form = UserCreateForm(data=dict(user_create_form_data,
+                                        username='striker9',
+                                        email='striker9@example.com',
+                                        verify_email='striker9@example.com'))
+        self.assertTrue(form.is_valid())
+
     # Invalid form data
     def test_UserCreateForm_invalid(self):
         form = UserCreateForm(data=user_create_form_data_incorrect)
         self.assertFalse(form.is_valid())
 
+    # Email and username uniqueness is checked with a single query
+    def assertDuplicateErrors(self, email, username, expected):
+        User.objects.create_user(
+            first_name='Test',
+            last_name='User',
+            email='testing@gmail.com',
+            username='testing',
+            password='password'
+        )
+        form = UserCreateForm(data=dict(user_create_form_data,
+                                        email=email,
+                                        verify_email=email,
+                                        username=username))
+        with self.assertNumQueries(1):
+            self.assertFalse(form.is_valid())
+        for field in ('email', 'username'):
+            if field in expected:
+                self.assertIn(field, form.errors)
+            else:
+                self.assertNotIn(field, form.errors)
+
+    def test_UserCreateForm_duplicate(self):
+        self.assertDuplicateErrors('Testing@Gmail.com', 'testing',
+                                   ('email', 'username'))
+
+    def test_UserCreateForm_duplicate_email(self):
+        self.assertDuplicateErrors('testing@gmail.com', 'striker9',
+                                   ('email',))
+
+    def test_UserCreateForm_duplicate_username(self):
+        self.assertDuplicateErrors('striker9@example.com', 'testing',
+                                   ('username',))
+
 
 class UserUpdateFormTests(TestCase):
 
@@ -236,6 +303,33 @@ class UserUpdateFormTests(TestCase):
         self.assertFalse(form.is_valid())
 
 
+class UserUpdateEmailTests(TestCase):
+
+    # Emails differing only in the case of the domain match
+    def test_UserUpdateEmail_domain_case(self):
+        form = UserUpdateEmail(data={
+            'email': 'brianweber2@gmail.com',
+            'verify_email': 'brianweber2@GMAIL.com'
+        })
+        self.assertTrue(form.is_valid())
+
+    # Emails differing only in the case of the local part match
+    def test_UserUpdateEmail_local_part_case(self):
+        form = UserUpdateEmail(data={
+            'email': 'brianweber2@gmail.com',
+            'verify_email': 'BrianWeber2@gmail.com'
+        })
+        self.assertTrue(form.is_valid())
+
+    # Different emails do not match
+    def test_UserUpdateEmail_invalid(self):
+        form = UserUpdateEmail(data={
+            'email': 'brianweber2@gmail.com',
+            'verify_email': 'brianweber@gmail.com'
+        })
+        self.assertFalse(form.is_valid())
+
+
 class ValidatingPasswordChangeFormTests(TestDataMixin, TestCase):
 
     def setUp(self):
@@ -285,6 +379,21 @@ class ValidatingPasswordChangeFormTests(TestDataMixin, TestCase):
             request=request)
         self.assertFalse(form.is_valid())
 
+    # Check minimum length of the new password
+    def test_new_password_too_short(self):
+        request = self.factory.get('/accounts/profile/change_password/')
+        request.user = self.user
+
+        form = ValidatingPasswordChangeForm(
+            user=request.user,
+            data={
+                'old_password': 'password',
+                'new_password1': 'Abu$edSurf17',
+                'new_password2': 'Abu$edSurf17'},
+            request=request)
+        self.assertFalse(form.is_valid())
+        self.assertIn('new_password2', form.errors)
+
     # Check if new password has uppercase letters
     def test_new_password_upper_lettters(self):
         request = self.factory.get('/accounts/profile/change_password/')
@@ -366,3 +475,23 @@ class ValidatingPasswordChangeFormTests(TestDataMixin, TestCase):
                 'new_password2': 'Abu$edSurfer17!Test'},
             request=request)
         self.assertFalse(form.is_valid())
+
+
+#####################################
+########## Validator Tests ##########
+#####################################
+class CharacterClassValidatorTests(TestCase):
+
+    def setUp(self):
+        self.validator = CharacterClassValidator()
+
+    # Valid password
+    def test_valid_password(self):
+        self.assertIsNone(self.validator.validate('Abu$edSurfer17!'))
+
+    # Invalid passwords
+    def test_missing_character_classes(self):
+        for password in ('abu$edsurfer17!', 'ABU$EDSURFER17!',
+                         'Abu$edSurfer!', 'AbusedSurfer17!'):
+            with self.assertRaises(ValidationError):
+                self.validator.validate(password)
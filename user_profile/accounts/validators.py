@@ -0,0 +1,47 @@
+from django.core.exceptions import ValidationError
+from django.utils.translation import ugettext_lazy as _
+
+
+_SPECIALS = frozenset('@#$')
+
+
+class CharacterClassValidator(object):
+    """Validate that a password mixes letter cases, digits and special
+    characters."""
+    def validate(self, password, user=None):
+        # Collect every required character class in a single pass
+        has_lower = has_upper = has_digit = has_special = False
+        for c in password:
+            if c.islower():
+                has_lower = True
+            elif c.isupper():
+                has_upper = True
+            elif c.isdigit():
+                has_digit = True
+            if c in _SPECIALS:
+                has_special = True
+            if has_lower and has_upper and has_digit and has_special:
+                break
+
+        # Must use both uppercase and lowercase letters
+        if not has_lower or not has_upper:
+            raise ValidationError(_("The new password must use both "
+                "uppercase and lowercase letters."),
+                code='password_no_mixed_case')
+
+        # Must include of one or more numerical digits
+        if not has_digit:
+            raise ValidationError(_("The new password must include one or "
+                "more numerical digits."),
+                code='password_no_digit')
+
+        # Must include of special characters, such as @, #, $
+        if not has_special:
+            raise ValidationError(_("The new password must include the at "
+                "least one of the following characters: @, #, or $."),
+                code='password_no_special')
+
+    def get_help_text(self):
+        return _("Your password must use both uppercase and lowercase "
+            "letters, one or more numerical digits and at least one of the "
+            "following characters: @, #, or $.")